@@ -7,23 +7,48 @@ statistics tracking in JSON format.
 """
 
 import time
+import math
 import sys
 import subprocess
 import json
 import os
-import numpy as np
-import sounddevice as sd
-from datetime import datetime
+import functools
+import atexit
+import signal
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, TypedDict
 import doctest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from jeepney import DBusAddress, MessageType, new_method_call
+    from jeepney.io.blocking import DBusConnection, open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    import sounddevice as sd
+
 WORK_MINUTES: int = 25
 SHORT_BREAK_MINUTES: int = 5
 LONG_BREAK_MINUTES: int = 15
 SESSIONS_BEFORE_LONG_BREAK: int = 4
 VOLUME: float = 1.0
 SAMPLE_RATE: int = 48000
-LOOP_DURATION: int = 10
+NOISE_BLOCKSIZE: int = 2048
+NOISE_LEAK: float = 1 - 1 / 4096
 STATS_FILE: str = "pomodoro_stats.json"
+NOTIFY_REPLY_TIMEOUT: float = 5.0
+PAUSE_ACTIONS: dict[str, str] = {"s": "skip", "q": "quit", "r": "resume"}
+TIMER_STRINGS: list[str] = [
+    f"{s // 60:02d}:{s % 60:02d}"
+    for s in range(max(WORK_MINUTES, SHORT_BREAK_MINUTES, LONG_BREAK_MINUTES) * 60 + 1)
+]
 
 
 def minutes_to_seconds(minutes: float) -> int:
@@ -49,6 +74,9 @@ def format_timer(seconds: float) -> str:
     """
     Convert seconds into a MM:SS string format.
 
+    Values up to the longest configured session are served from the
+    precomputed ``TIMER_STRINGS`` table.
+
     :param seconds: Total seconds to format.
     :type seconds: float
     :return: Formatted time string.
@@ -60,17 +88,33 @@ def format_timer(seconds: float) -> str:
     '00:59'
     >>> format_timer(-1)
     '00:00'
+    >>> format_timer(6000)
+    '100:00'
     """
     s = max(0, int(seconds))
+    if s < len(TIMER_STRINGS):
+        return TIMER_STRINGS[s]
     return f"{s // 60:02d}:{s % 60:02d}"
 
 
-def get_empty_stats() -> dict[str, int | str]:
+class Stats(TypedDict):
+    """
+    Schema of the persisted statistics file.
+    """
+
+    total_sessions: int
+    total_focus_minutes: int
+    total_break_minutes: int
+    days_active: int
+    last_run: str
+
+
+def get_empty_stats() -> Stats:
     """
     Generate a dictionary representing empty/initial statistics.
 
     :return: A dictionary with default keys for tracking pomodoros.
-    :rtype: dict[str, int | str]
+    :rtype: Stats
 
     >>> get_empty_stats()['total_sessions']
     0
@@ -84,14 +128,105 @@ def get_empty_stats() -> dict[str, int | str]:
     }
 
 
-def calculate_stats(
-    data: dict[str, int | str], minutes: int, is_work: bool, date_str: str
-) -> dict[str, int | str]:
+def parse_count(value: object) -> int:
     """
-    Update a statistics dictionary with new session data.
+    Convert a decoded JSON counter to an int, falling back to 0 if it is unusable.
+
+    :param value: Counter value as read from the statistics file.
+    :type value: object
+    :return: The counter as an int (fractions are truncated).
+    :rtype: int
+
+    >>> parse_count("3"), parse_count(4.0), parse_count(2.5)
+    (3, 4, 2)
+    >>> parse_count(None), parse_count("abc"), parse_count(float("inf"))
+    (0, 0, 0)
+    """
+    if isinstance(value, int):
+        return int(value)
+    try:
+        return int(float(value))
+    except TypeError, ValueError, OverflowError:
+        return 0
 
-    :param data: Current statistics data.
-    :type data: dict[str, int | str]
+
+def parse_stats(raw: object) -> Stats:
+    """
+    Coerce decoded JSON into the statistics schema, filling in missing keys.
+
+    Each counter is converted on its own with ``parse_count``, so one bad field
+    does not discard the others; keys outside the schema are kept so they
+    survive the next save.
+
+    :param raw: Value as decoded from the statistics file.
+    :type raw: object
+    :return: Statistics with integer counters and a string date.
+    :rtype: Stats
+    :raises ValueError: If ``raw`` is not a JSON object.
+
+    >>> parse_stats({'total_sessions': '3', 'last_run': '2025-01-01'})['total_sessions']
+    3
+    >>> parse_stats({})['days_active']
+    0
+    >>> d = parse_stats({'total_sessions': 40, 'total_break_minutes': None})
+    >>> d['total_sessions'], d['total_break_minutes']
+    (40, 0)
+    >>> parse_stats({'theme': 'dark'})['theme']
+    'dark'
+    >>> parse_stats([1])
+    Traceback (most recent call last):
+    ...
+    ValueError: statistics must be a JSON object
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("statistics must be a JSON object")
+    data = get_empty_stats()
+    data.update(raw)
+    data["total_sessions"] = parse_count(data["total_sessions"])
+    data["total_focus_minutes"] = parse_count(data["total_focus_minutes"])
+    data["total_break_minutes"] = parse_count(data["total_break_minutes"])
+    data["days_active"] = parse_count(data["days_active"])
+    if not isinstance(data["last_run"], str):
+        data["last_run"] = ""
+    return data
+
+
+def apply_session(data: Stats, minutes: int, is_work: bool, date_str: str) -> None:
+    """
+    Update a statistics dictionary in place with new session data.
+
+    :param data: Statistics data to modify.
+    :type data: Stats
+    :param minutes: Minutes spent in the current session.
+    :type minutes: int
+    :param is_work: True if the session was a work/focus session, False for a break.
+    :type is_work: bool
+    :param date_str: Current date in YYYY-MM-DD format.
+    :type date_str: str
+    :return: None
+
+    >>> d = get_empty_stats()
+    >>> apply_session(d, 25, True, "2025-01-01")
+    >>> int(d['total_focus_minutes']), d['last_run']
+    (25, '2025-01-01')
+    """
+    if is_work:
+        data["total_sessions"] += 1
+        data["total_focus_minutes"] += minutes
+    else:
+        data["total_break_minutes"] += minutes
+
+    if data["last_run"] != date_str:
+        data["days_active"] += 1
+        data["last_run"] = date_str
+
+
+def calculate_stats(data: Stats, minutes: int, is_work: bool, date_str: str) -> Stats:
+    """
+    Return a copy of a statistics dictionary updated with new session data.
+
+    :param data: Current statistics data (left unchanged).
+    :type data: Stats
     :param minutes: Minutes spent in the current session.
     :type minutes: int
     :param is_work: True if the session was a work/focus session, False for a break.
@@ -99,7 +234,7 @@ def calculate_stats(
     :param date_str: Current date in YYYY-MM-DD format.
     :type date_str: str
     :return: A new updated dictionary.
-    :rtype: dict[str, int | str]
+    :rtype: Stats
 
     >>> d = get_empty_stats()
     >>> d = calculate_stats(d, 25, True, "2025-01-01")
@@ -113,24 +248,16 @@ def calculate_stats(
     2
     """
     new_data = data.copy()
-    if is_work:
-        new_data["total_sessions"] = int(new_data["total_sessions"]) + 1
-        new_data["total_focus_minutes"] = int(new_data["total_focus_minutes"]) + minutes
-    else:
-        new_data["total_break_minutes"] = int(new_data["total_break_minutes"]) + minutes
-
-    if new_data["last_run"] != date_str:
-        new_data["days_active"] = int(new_data["days_active"]) + 1
-        new_data["last_run"] = date_str
+    apply_session(new_data, minutes, is_work, date_str)
     return new_data
 
 
-def format_report(data: dict[str, int | str], session_today: int) -> str:
+def format_report(data: Stats, session_today: int) -> str:
     """
     Generate a human-readable progress report string.
 
     :param data: The cumulative statistics dictionary.
-    :type data: dict[str, int | str]
+    :type data: Stats
     :param session_today: Count of sessions completed in the current run.
     :type session_today: int
     :return: Formatted ASCII report.
@@ -142,7 +269,7 @@ def format_report(data: dict[str, int | str], session_today: int) -> str:
     >>> "Current Streak:  3" in format_report(d, 3)
     True
     """
-    focus_mins = int(data.get("total_focus_minutes", 0))
+    focus_mins = data.get("total_focus_minutes", 0)
     h, m = focus_mins // 60, focus_mins % 60
     return (
         f"\n{'=' * 40}\n📊 PROGRESS REPORT\n"
@@ -174,26 +301,61 @@ def get_session_config(count: int, long_freq: int = 4) -> tuple[int, str]:
     return SHORT_BREAK_MINUTES, "Short Break"
 
 
-def normalize_audio(audio_array: np.ndarray, target_vol: float) -> np.ndarray:
+def decay_curve(leak: float, length: int) -> np.ndarray:
     """
-    Normalize a numpy audio array to a target peak volume.
+    Precompute the float32 powers ``leak ** k`` used by ``integrate_brown_noise``.
 
-    :param audio_array: The raw audio signal.
-    :type audio_array: np.ndarray
-    :param target_vol: Target peak amplitude (0.0 to 1.0).
-    :type target_vol: float
-    :return: Normalized audio signal.
+    :param leak: Integrator feedback coefficient (0.0 to 1.0).
+    :type leak: float
+    :param length: Number of samples per block.
+    :type length: int
+    :return: Array of ``leak ** 0`` up to ``leak ** (length - 1)``.
     :rtype: np.ndarray
 
-    >>> arr = np.array([-2.0, 0.0, 2.0])
-    >>> normalized = normalize_audio(arr, 0.5)
-    >>> float(np.max(normalized))
-    0.5
+    >>> decay_curve(0.5, 3).tolist()
+    [1.0, 0.5, 0.25]
     """
-    peak = np.max(np.abs(audio_array))
-    if peak > 0:
-        audio_array = audio_array / peak
-    return audio_array * target_vol
+    import numpy as np
+
+    return leak ** np.arange(length, dtype=np.float32)
+
+
+def integrate_brown_noise(
+    block: np.ndarray, state: float, leak: float, decay: np.ndarray
+) -> float:
+    """
+    Turn a block of white noise into brown noise in place with a leaky integrator.
+
+    Each sample becomes ``y[n] = leak * y[n-1] + block[n]``; a leak just below 1
+    keeps the walk from drifting away from zero over a long session.
+
+    :param block: White noise samples; overwritten with the integrated signal.
+    :type block: np.ndarray
+    :param state: Last output sample of the previous block (0.0 to start).
+    :type state: float
+    :param leak: Integrator feedback coefficient (0.0 to 1.0).
+    :type leak: float
+    :param decay: ``decay_curve(leak, n)`` for some ``n`` of at least the block size.
+    :type decay: np.ndarray
+    :return: The last output sample, to pass as ``state`` for the next block.
+    :rtype: float
+
+    >>> import numpy as np
+    >>> block = np.ones(4, dtype=np.float32)
+    >>> integrate_brown_noise(block, 0.0, 1.0, decay_curve(1.0, 4))
+    4.0
+    >>> block.tolist()
+    [1.0, 2.0, 3.0, 4.0]
+    >>> block = np.zeros(2, dtype=np.float32)
+    >>> integrate_brown_noise(block, 4.0, 0.5, decay_curve(0.5, 4))
+    1.0
+    """
+    decay = decay[: len(block)]
+    block /= decay
+    block.cumsum(out=block)
+    block += leak * state
+    block *= decay
+    return float(block[-1])
 
 
 def parse_pause_input(user_str: str) -> str:
@@ -214,9 +376,7 @@ def parse_pause_input(user_str: str) -> str:
     >>> parse_pause_input("")
     'resume'
     """
-    cleaned = user_str.strip().lower()
-    mapping = {"s": "skip", "q": "quit", "r": "resume"}
-    return mapping.get(cleaned, "resume")
+    return PAUSE_ACTIONS.get(user_str.strip().lower(), "resume")
 
 
 def get_notification_cmd(title: str, msg: str) -> list[str]:
@@ -236,9 +396,32 @@ def get_notification_cmd(title: str, msg: str) -> list[str]:
     return ["notify-send", "-u", "critical", title, msg]
 
 
+def get_notification_args(title: str, msg: str) -> tuple:
+    """
+    Build the argument tuple for org.freedesktop.Notifications.Notify.
+
+    Mirrors ``get_notification_cmd``: a critical-urgency notification with the
+    server's default timeout.
+
+    :param title: Notification title.
+    :type title: str
+    :param msg: Notification body text.
+    :type msg: str
+    :return: Arguments matching the D-Bus signature ``susssasa{sv}i``.
+    :rtype: tuple
+
+    >>> get_notification_args("Hi", "Bye")
+    ('pomodoro', 0, '', 'Hi', 'Bye', [], {'urgency': ('y', 2)}, -1)
+    """
+    return ("pomodoro", 0, "", title, msg, [], {"urgency": ("y", 2)}, -1)
+
+
 class StatsManager:
     """
     Handles loading, saving, and updating Pomodoro statistics from a JSON file.
+
+    Work sessions are written immediately; break updates are kept in memory until
+    the next work save, or flushed when the interpreter exits.
     """
 
     def __init__(self, path: str) -> None:
@@ -249,35 +432,88 @@ class StatsManager:
         :type path: str
         """
         self.path: str = path
-        self.data: dict[str, int | str] = self.load()
+        self.data: Stats = self.load()
+        self.dirty: bool = False
+        self.today: str = ""
+        self.today_ends: float = 0.0
+        atexit.register(self.flush)
 
-    def load(self) -> dict[str, int | str]:
+    def load(self) -> Stats:
         """
         Load statistics from the file or return defaults if file is missing/corrupt.
+        A file that cannot be decoded is moved aside to ``<path>.bak`` so the next
+        save does not overwrite it.
+
+        Counters are coerced to ``int`` here so updates can use plain arithmetic.
+        Other read errors (e.g. permissions) propagate rather than letting a later
+        save replace a file that could not be read.
 
         :return: Loaded statistics.
-        :rtype: dict[str, int | str]
+        :rtype: Stats
         """
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError, IOError:
-                pass
-        return get_empty_stats()
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return get_empty_stats()
+        try:
+            if orjson is not None:
+                return parse_stats(orjson.loads(raw))
+            return parse_stats(json.loads(raw))
+        except ValueError:
+            backup = f"{self.path}.bak"
+            os.replace(self.path, backup)
+            print(f"⚠️  Could not parse {self.path}; moved it to {backup}.")
+            return get_empty_stats()
 
     def save(self) -> None:
         """
-        Write the current data dictionary to the JSON file.
+        Atomically write the current data dictionary to the JSON file.
+
+        Uses ``orjson`` when it is installed and the standard library otherwise;
+        both produce the same two-space indented layout.
 
         :return: None
         """
-        with open(self.path, "w") as f:
-            json.dump(self.data, f, indent=4)
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=2).encode()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def flush(self) -> None:
+        """
+        Save to disk if there are updates that have not been written yet.
+
+        :return: None
+        """
+        if self.dirty:
+            self.save()
+
+    def current_date(self) -> str:
+        """
+        Return today's date as YYYY-MM-DD, reformatting it only after midnight.
+
+        :return: The cached local date string.
+        :rtype: str
+        """
+        if time.time() >= self.today_ends:
+            now = datetime.now()
+            self.today = now.strftime("%Y-%m-%d")
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            self.today_ends = (midnight + timedelta(days=1)).timestamp()
+        return self.today
 
     def update(self, minutes: int, is_work: bool) -> None:
         """
-        Calculate new stats based on a finished session and save to disk.
+        Calculate new stats based on a finished session; save work sessions at
+        once and defer break updates to the next work save or exit.
 
         :param minutes: Duration of the session finished.
         :type minutes: int
@@ -285,33 +521,110 @@ class StatsManager:
         :type is_work: bool
         :return: None
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-        self.data = calculate_stats(self.data, minutes, is_work, today)
-        self.save()
+        apply_session(self.data, minutes, is_work, self.current_date())
+        self.dirty = True
+        if is_work:
+            self.save()
 
 
-def generate_brown_noise(duration: int) -> np.ndarray:
+class NoiseStream:
+    """
+    Streams endless brown noise to the default audio output, block by block.
     """
-    Generate a brown noise signal using FFT.
 
-    :param duration: Duration of noise in seconds.
-    :type duration: int
-    :return: Normalized brown noise as a numpy array.
-    :rtype: np.ndarray
+    def __init__(self, volume: float) -> None:
+        """
+        Open an output stream whose callback synthesizes the noise on demand.
+
+        :param volume: Target amplitude at four standard deviations (0.0 to 1.0).
+        :type volume: float
+        """
+        import numpy as np
+        import sounddevice as sd
+
+        self.rng: np.random.Generator = np.random.default_rng()
+        self.state: float = 0.0
+        self.decay: np.ndarray = decay_curve(NOISE_LEAK, NOISE_BLOCKSIZE)
+        self.gain: float = volume * math.sqrt(1 - NOISE_LEAK**2) / 4
+        self.stream = sd.OutputStream(
+            samplerate=SAMPLE_RATE,
+            channels=1,
+            dtype="float32",
+            blocksize=NOISE_BLOCKSIZE,
+            callback=self.callback,
+        )
+
+    def callback(
+        self,
+        outdata: np.ndarray,
+        frames: int,
+        time_info: object,
+        status: sd.CallbackFlags,
+    ) -> None:
+        """
+        Fill the device buffer in place with the next block of brown noise.
+
+        :param outdata: Output buffer of shape (frames, 1) provided by sounddevice.
+        :type outdata: np.ndarray
+        :param frames: Number of frames requested.
+        :type frames: int
+        :param time_info: PortAudio timestamps for the block (unused).
+        :type time_info: object
+        :param status: Underflow/overflow flags reported by sounddevice (unused).
+        :type status: sd.CallbackFlags
+        :return: None
+        """
+        block = outdata[:, 0]
+        self.rng.standard_normal(dtype=block.dtype, out=block)
+        self.state = integrate_brown_noise(block, self.state, NOISE_LEAK, self.decay)
+        block *= self.gain
+        block.clip(-1.0, 1.0, out=block)
+
+    def start(self) -> None:
+        """
+        Start (or resume) playback.
+
+        :return: None
+        """
+        self.stream.start()
+
+    def stop(self) -> None:
+        """
+        Pause playback, keeping the integrator state for a seamless resume.
+
+        :return: None
+        """
+        self.stream.stop()
+
+    def close(self) -> None:
+        """
+        Stop playback and release the audio device.
+
+        :return: None
+        """
+        self.stream.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_dbus_connection() -> DBusConnection | None:
     """
-    n = int(SAMPLE_RATE * duration)
-    f = np.arange(n // 2 + 1)
-    f[0] = 1
-    spec = (np.random.normal(0, 1, len(f)) + 1j * np.random.normal(0, 1, len(f))) * (
-        1 / f
-    )
-    spec[0] = 0
-    return normalize_audio(np.fft.irfft(spec, n=n), VOLUME)
+    Open the session bus connection once and reuse it for every notification.
+
+    :return: The connection, or None if jeepney or a session bus is unavailable.
+    :rtype: DBusConnection | None
+    """
+    if open_dbus_connection is None or "DBUS_SESSION_BUS_ADDRESS" not in os.environ:
+        return None
+    try:
+        return open_dbus_connection(bus="SESSION")
+    except OSError, ValueError:
+        return None
 
 
 def notify(title: str, msg: str) -> None:
     """
-    Trigger a desktop notification. Fails silently if notify-send is unavailable.
+    Trigger a desktop notification over D-Bus, falling back to notify-send.
+    Fails silently if neither is available.
 
     :param title: Title of notification.
     :type title: str
@@ -319,6 +632,27 @@ def notify(title: str, msg: str) -> None:
     :type msg: str
     :return: None
     """
+    connection = get_dbus_connection()
+    if connection is not None:
+        message = new_method_call(
+            DBusAddress(
+                "/org/freedesktop/Notifications",
+                bus_name="org.freedesktop.Notifications",
+                interface="org.freedesktop.Notifications",
+            ),
+            "Notify",
+            "susssasa{sv}i",
+            get_notification_args(title, msg),
+        )
+        try:
+            reply = connection.send_and_get_reply(message, timeout=NOTIFY_REPLY_TIMEOUT)
+            if reply.header.message_type != MessageType.error:
+                return
+        except TimeoutError:
+            # The request is already out; a slow daemon will still show it.
+            return
+        except OSError:
+            get_dbus_connection.cache_clear()
     try:
         subprocess.run(get_notification_cmd(title, msg), check=False)
     except subprocess.SubprocessError, FileNotFoundError:
@@ -333,37 +667,50 @@ def countdown(minutes: int, label: str, play_sound: bool = False) -> str:
     :type minutes: int
     :param label: Text label to display (e.g., 'Focus Session').
     :type label: str
-    :param play_sound: If True, loops brown noise during the countdown.
+    :param play_sound: If True, streams brown noise during the countdown.
     :type play_sound: bool
     :return: A status string indicating 'completed' or 'skipped'.
     :rtype: str
     """
-    total_sec = minutes_to_seconds(minutes)
-    noise = generate_brown_noise(LOOP_DURATION) if play_sound else None
+    deadline = time.monotonic() + minutes_to_seconds(minutes)
+    noise = NoiseStream(VOLUME) if play_sound else None
 
-    if play_sound and noise is not None:
-        sd.play(noise, SAMPLE_RATE, loop=True)
+    shown = -1
+    try:
+        if noise is not None:
+            noise.start()
+        while True:
+            try:
+                remaining = deadline - time.monotonic()
+                total_sec = max(0, math.ceil(remaining))
+                if total_sec != shown:
+                    print(
+                        f"\r[{label}] {format_timer(total_sec)} (Ctrl+C to Pause) ",
+                        end="",
+                        flush=True,
+                    )
+                    shown = total_sec
+                if remaining <= 0:
+                    break
+                time.sleep(remaining - (total_sec - 1))
+            except KeyboardInterrupt:
+                paused_at = time.monotonic()
+                if noise is not None:
+                    noise.stop()
+                print("\n\n⏸️  PAUSED")
+                action = parse_pause_input(input("Options: [R]esume, [S]kip, [Q]uit: "))
+                if action == "skip":
+                    return "skipped"
+                if action == "quit":
+                    sys.exit()
+                deadline += time.monotonic() - paused_at
+                shown = -1
+                if noise is not None:
+                    noise.start()
+    finally:
+        if noise is not None:
+            noise.close()
 
-    while total_sec >= 0:
-        try:
-            sys.stdout.write(
-                f"\r[{label}] {format_timer(total_sec)} (Ctrl+C to Pause) "
-            )
-            sys.stdout.flush()
-            time.sleep(1)
-            total_sec -= 1
-        except KeyboardInterrupt:
-            sd.stop()
-            print("\n\n⏸️  PAUSED")
-            action = parse_pause_input(input("Options: [R]esume, [S]kip, [Q]uit: "))
-            if action == "skip":
-                return "skipped"
-            if action == "quit":
-                sys.exit()
-            if play_sound and noise is not None:
-                sd.play(noise, SAMPLE_RATE, loop=True)
-
-    sd.stop()
     print(f"\n🔔 {label} finished!")
     notify("Pomodoro", f"{label} finished!")
     return "completed"
@@ -371,16 +718,22 @@ def countdown(minutes: int, label: str, play_sound: bool = False) -> str:
 
 def main() -> None:
     """
-    Main entry point for the Pomodoro application. Runs doctests and then the loop.
+    Main entry point for the Pomodoro application. Runs the loop, or only the
+    doctests when started with ``--test``.
 
     :return: None
     """
-    test_results = doctest.testmod()
-    if test_results.failed > 0:
-        print("❌ Logic validation failed. Safety shutdown.")
-        sys.exit(1)
+    if "--test" in sys.argv:
+        test_results = doctest.testmod()
+        if test_results.failed > 0:
+            print("❌ Logic validation failed.")
+            sys.exit(1)
+        sys.exit(0)
 
     stats = StatsManager(STATS_FILE)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: sys.exit())
     session_count: int = 0
 
     print("Starting 🍅")